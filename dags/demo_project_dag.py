@@ -1,78 +1,109 @@
 from airflow import DAG
+from airflow.providers.standard.operators.python import BranchPythonOperator
 from airflow.providers.standard.operators.python import PythonOperator
 
 from pathlib import Path
-from dataclasses import dataclass
 
-from layers.landing_zone import query_weather_api
-from layers.landing_zone import query_air_quality_api
+from layers.landing_zone import City
+from layers.landing_zone import fetch_all_async
 from layers.bronze_layer import transform_weather_data_to_parquet
 from layers.bronze_layer import transform_air_quality_data_to_parquet
+from layers.bronze_layer import fetch_weather_data_to_parquet
+from layers.bronze_layer import fetch_air_quality_data_to_parquet
 from layers.silver_layer import merge_and_clean_dataframes
 from layers.golden_layer import calculate_analytics
 
 
-@dataclass
-class City:
-    latitude: float
-    longitude: float
-    name: str
+CITIES: list[City] = [
+    City(50.450, 30.524, "Kyiv"),
+    City(44.616, 33.525, "Sevastopol"),
+    City(48.015, 37.802, "Donetsk"),
+]
 
+_PIPELINE_HOME: Path = Path.home() / "weather_pipeline"
+LANDING_ZONE_PATH: Path = _PIPELINE_HOME / "landing_zone"
+BRONZE_LAYER_PATH: Path = _PIPELINE_HOME / "bronze_layer"
+SILVER_LAYER_PATH: Path = _PIPELINE_HOME / "silver_layer"
+GOLDEN_LAYER_PATH: Path = _PIPELINE_HOME / "golden_layer"
 
-with DAG(dag_id="demo_project_dag", schedule="@hourly", catchup=False) as dag:
-    cities: list[City] = [
-        City(50.450, 30.524, "Kyiv"),
-        City(44.616, 33.525, "Sevastopol"),
-        City(48.015, 37.802, "Donetsk"),
-    ]
 
-    landing_zone_path: Path = Path.home() / "weather_pipeline/landing_zone"
-    bronze_layer_path: Path = Path.home() / "weather_pipeline/bronze_layer"
-    silver_layer_path: Path = Path.home() / "weather_pipeline/silver_layer"
-    golden_layer_path: Path = Path.home() / "weather_pipeline/golden_layer"
+def choose_ingestion_path(params: dict, direct_task_ids: list[str]) -> list[str]:
+    # Landing zone keeps the raw JSON for archival; direct mode skips that round-trip
+    if params["direct_to_bronze"]:
+        return direct_task_ids
+    return ["landing_zone"]
+
 
-    landing_tasks_weather: list[PythonOperator] = [
+with DAG(
+    dag_id="demo_project_dag",
+    schedule="@hourly",
+    catchup=False,
+    params={"direct_to_bronze": False},
+) as dag:
+    direct_bronze_layer_weather: list[PythonOperator] = [
         PythonOperator(
-            task_id=f"landing_zone_weather_api_{city.name.lower()}",
-            python_callable=query_weather_api,
+            task_id=f"direct_bronze_layer_weather_{city.name.lower()}",
+            python_callable=fetch_weather_data_to_parquet,
             op_kwargs={
-                "base_output_path": landing_zone_path,
+                "base_output_path": BRONZE_LAYER_PATH,
                 "longitude": city.longitude,
                 "latitude": city.latitude,
                 "city_name": city.name,
                 "execution_time": "{{ ds }}",
             },
         )
-        for city in cities
+        for city in CITIES
     ]
 
-    landing_tasks_air_quality: list[PythonOperator] = [
+    direct_bronze_layer_air_quality: list[PythonOperator] = [
         PythonOperator(
-            task_id=f"landing_zone_air_quality_api_{city.name.lower()}",
-            python_callable=query_air_quality_api,
+            task_id=f"direct_bronze_layer_air_quality_{city.name.lower()}",
+            python_callable=fetch_air_quality_data_to_parquet,
             op_kwargs={
-                "base_output_path": landing_zone_path,
+                "base_output_path": BRONZE_LAYER_PATH,
                 "longitude": city.longitude,
                 "latitude": city.latitude,
                 "city_name": city.name,
                 "execution_time": "{{ ds }}",
             },
         )
-        for city in cities
+        for city in CITIES
     ]
 
+    direct_bronze_tasks: list[PythonOperator] = (
+        direct_bronze_layer_weather + direct_bronze_layer_air_quality
+    )
+
+    choose_ingestion_path_task: BranchPythonOperator = BranchPythonOperator(
+        task_id="choose_ingestion_path",
+        python_callable=choose_ingestion_path,
+        op_kwargs={
+            "direct_task_ids": [task.task_id for task in direct_bronze_tasks],
+        },
+    )
+
+    landing_zone_task: PythonOperator = PythonOperator(
+        task_id="landing_zone",
+        python_callable=fetch_all_async,
+        op_kwargs={
+            "base_output_path": LANDING_ZONE_PATH,
+            "cities": CITIES,
+            "execution_time": "{{ ds }}",
+        },
+    )
+
     bronze_layer_weather: list[PythonOperator] = [
         PythonOperator(
             task_id=f"bronze_layer_weather_{city.name.lower()}",
             python_callable=transform_weather_data_to_parquet,
             op_kwargs={
-                "base_input_path": landing_zone_path,
-                "base_output_path": bronze_layer_path,
+                "base_input_path": LANDING_ZONE_PATH,
+                "base_output_path": BRONZE_LAYER_PATH,
                 "city_name": city.name,
                 "execution_time": "{{ ds }}",
             },
         )
-        for city in cities
+        for city in CITIES
     ]
 
     bronze_layer_air_quality: list[PythonOperator] = [
@@ -80,40 +111,44 @@ with DAG(dag_id="demo_project_dag", schedule="@hourly", catchup=False) as dag:
             task_id=f"bronze_layer_air_quality_{city.name.lower()}",
             python_callable=transform_air_quality_data_to_parquet,
             op_kwargs={
-                "base_input_path": landing_zone_path,
-                "base_output_path": bronze_layer_path,
+                "base_input_path": LANDING_ZONE_PATH,
+                "base_output_path": BRONZE_LAYER_PATH,
                 "city_name": city.name,
                 "execution_time": "{{ ds }}",
             },
         )
-        for city in cities
+        for city in CITIES
     ]
 
     silver_layer_task: PythonOperator = PythonOperator(
         task_id="silver_layer",
         python_callable=merge_and_clean_dataframes,
         op_kwargs={
-            "base_input_path": bronze_layer_path,
-            "base_output_path": silver_layer_path,
+            "base_input_path": BRONZE_LAYER_PATH,
+            "base_output_path": SILVER_LAYER_PATH,
             "prefixes": ["weather_data", "air_quality_data"],
             "execution_time": "{{ ds }}",
         },
+        # Only one ingestion branch runs, the other one is skipped
+        trigger_rule="none_failed_min_one_success",
     )
 
     golden_layer_task: PythonOperator = PythonOperator(
         task_id="golden_layer",
         python_callable=calculate_analytics,
         op_kwargs={
-            "base_input_path": silver_layer_path,
-            "base_output_path": golden_layer_path,
+            "base_input_path": SILVER_LAYER_PATH,
+            "base_output_path": GOLDEN_LAYER_PATH,
             "execution_time": "{{ ds }}",
         },
     )
 
-    for landing, bronze in zip(landing_tasks_weather, bronze_layer_weather):
-        landing >> bronze >> silver_layer_task
+    choose_ingestion_path_task >> landing_zone_task
+
+    for bronze in bronze_layer_weather + bronze_layer_air_quality:
+        landing_zone_task >> bronze >> silver_layer_task
 
-    for landing, bronze in zip(landing_tasks_air_quality, bronze_layer_air_quality):
-        landing >> bronze >> silver_layer_task
+    for direct_bronze in direct_bronze_tasks:
+        choose_ingestion_path_task >> direct_bronze >> silver_layer_task
 
     silver_layer_task >> golden_layer_task
@@ -1,9 +1,17 @@
 import polars as pl
 import datetime
-import json
+import io
 from pathlib import Path
+from functools import lru_cache
 from loguru import logger
 
+from layers.landing_zone import AIR_QUALITY_API_URL
+from layers.landing_zone import AIR_QUALITY_INDICATORS
+from layers.landing_zone import FORECAST_DAYS
+from layers.landing_zone import WEATHER_API_URL
+from layers.landing_zone import WEATHER_INDICATORS
+from layers.landing_zone import request_api_data
+
 
 def _get_input_path(
     base_input_path: Path,
@@ -14,13 +22,52 @@ def _get_input_path(
     return base_input_path / execution_time / prefix / f"{city_name}.json"
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
 def _get_output_path(base_output_path: Path, execution_time: str, prefix: str) -> Path:
     write_path: Path = base_output_path / execution_time / prefix
 
-    write_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(str(write_path))
     return write_path
 
 
+def _parse_hourly_json(source: Path | io.BytesIO, city_name: str) -> pl.DataFrame:
+    # Parse with polars' native JSON reader, then turn the "hourly" lists into rows
+    return (
+        pl.read_json(source)
+        .select(pl.col("hourly").struct.unnest())
+        .explode(pl.all())
+        .with_columns(
+            pl.col("time").str.to_datetime("%Y-%m-%dT%H:%M"),
+            pl.lit(city_name).alias("city_name"),
+        )
+    )
+
+
+def _write_parquet(
+    content_df: pl.DataFrame,
+    base_output_path: Path,
+    city_name: str,
+    execution_time: str,
+    prefix: str,
+) -> None:
+    write_path: Path = _get_output_path(
+        base_output_path=base_output_path,
+        execution_time=execution_time,
+        prefix=prefix,
+    )
+
+    # Each city file holds FORECAST_DAYS of hourly rows; split it into two row groups
+    content_df.sort(["city_name", "time"]).write_parquet(
+        write_path / f"{city_name}.parquet",
+        statistics=True,
+        row_group_size=FORECAST_DAYS * 24 // 2,
+    )
+
+
 def _transform_json_data_to_parquet(
     base_input_path: Path,
     base_output_path: Path,
@@ -34,21 +81,43 @@ def _transform_json_data_to_parquet(
         prefix=prefix,
         city_name=city_name,
     )
-    with open(input_path) as file:
-        landing_zone_data: dict = json.load(file)
+    content_df: pl.DataFrame = _parse_hourly_json(input_path, city_name)
 
-    content_df: pl.DataFrame = pl.from_dict(landing_zone_data["hourly"]).with_columns(
-        pl.lit(city_name).alias("city_name")
+    _write_parquet(
+        content_df=content_df,
+        base_output_path=base_output_path,
+        city_name=city_name,
+        execution_time=execution_time,
+        prefix=prefix,
     )
 
-    write_path: Path = _get_output_path(
+
+def _fetch_json_data_to_parquet(
+    base_output_path: Path,
+    latitude: float,
+    longitude: float,
+    city_name: str,
+    execution_time: str,
+    prefix: str,
+    api_url: str,
+    indicators: list[str],
+) -> None:
+    content: bytes = request_api_data(
+        api_url=api_url,
+        indicators=indicators,
+        latitude=latitude,
+        longitude=longitude,
+    )
+    content_df: pl.DataFrame = _parse_hourly_json(io.BytesIO(content), city_name)
+
+    _write_parquet(
+        content_df=content_df,
         base_output_path=base_output_path,
+        city_name=city_name,
         execution_time=execution_time,
         prefix=prefix,
     )
 
-    content_df.write_parquet(write_path / f"{city_name}.parquet")
-
 
 def transform_weather_data_to_parquet(
     base_input_path: Path,
@@ -84,3 +153,47 @@ def transform_air_quality_data_to_parquet(
         execution_time=execution_time,
         prefix="air_quality_data",
     )
+
+
+def fetch_weather_data_to_parquet(
+    base_output_path: Path,
+    latitude: float,
+    longitude: float,
+    city_name: str,
+    execution_time: str,
+) -> None:
+    logger.info(
+        f"Fetching weather indicators straight to parquet table representation for city {city_name}"
+    )
+    _fetch_json_data_to_parquet(
+        base_output_path=base_output_path,
+        latitude=latitude,
+        longitude=longitude,
+        city_name=city_name,
+        execution_time=execution_time,
+        prefix="weather_data",
+        api_url=WEATHER_API_URL,
+        indicators=WEATHER_INDICATORS,
+    )
+
+
+def fetch_air_quality_data_to_parquet(
+    base_output_path: Path,
+    latitude: float,
+    longitude: float,
+    city_name: str,
+    execution_time: str,
+) -> None:
+    logger.info(
+        f"Fetching air quality indicators straight to parquet table representation for city {city_name}"
+    )
+    _fetch_json_data_to_parquet(
+        base_output_path=base_output_path,
+        latitude=latitude,
+        longitude=longitude,
+        city_name=city_name,
+        execution_time=execution_time,
+        prefix="air_quality_data",
+        api_url=AIR_QUALITY_API_URL,
+        indicators=AIR_QUALITY_INDICATORS,
+    )
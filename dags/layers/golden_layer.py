@@ -2,13 +2,13 @@ import polars as pl
 import datetime
 from loguru import logger
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 
 
-def analyze_precipitation_effect(df: pl.DataFrame) -> pl.DataFrame:
-    """Analyze precipitation effects using Polars"""
-
-    logger.info("\n🌧️ PRECIPITATION IMPACT ANALYSIS")
-    logger.info("=" * 40)
+def analyze_precipitation_effect(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Build lazy precipitation effects analysis using Polars"""
 
     # Add precipitation flag
     df_with_flag = df.with_columns(
@@ -17,7 +17,7 @@ def analyze_precipitation_effect(df: pl.DataFrame) -> pl.DataFrame:
 
     # Group by precipitation presence
     precip_analysis = (
-        df_with_flag.group_by("has_precipitation")
+        df_with_flag.group_by("has_precipitation", maintain_order=False)
         .agg(
             [
                 pl.col("pm2_5").mean().alias("avg_pm2_5"),
@@ -30,40 +30,55 @@ def analyze_precipitation_effect(df: pl.DataFrame) -> pl.DataFrame:
         .sort("has_precipitation")
     )
 
+    return precip_analysis
+
+
+def report_precipitation_effect(precip_analysis: pl.DataFrame) -> None:
+    """Log collected precipitation effects analysis"""
+
+    logger.info("\n🌧️ PRECIPITATION IMPACT ANALYSIS")
+    logger.info("=" * 40)
+
     logger.info(precip_analysis)
 
     # Calculate improvement percentages
-    no_rain = precip_analysis.filter(~pl.col("has_precipitation"))
-    with_rain = precip_analysis.filter(pl.col("has_precipitation"))
+    no_rain_pm25, with_rain_pm25 = precip_analysis.select(
+        [
+            pl.col("avg_pm2_5")
+            .filter(~pl.col("has_precipitation"))
+            .first()
+            .alias("no_rain_pm25"),
+            pl.col("avg_pm2_5")
+            .filter(pl.col("has_precipitation"))
+            .first()
+            .alias("with_rain_pm25"),
+        ]
+    ).row(0)
 
-    if no_rain.height > 0 and with_rain.height > 0:
-        no_rain_pm25 = no_rain["avg_pm2_5"].item()
-        with_rain_pm25 = with_rain["avg_pm2_5"].item()
+    if no_rain_pm25 is not None and with_rain_pm25 is not None:
         pm25_improvement = ((no_rain_pm25 - with_rain_pm25) / no_rain_pm25) * 100
 
         logger.info(f"\n📊 PM2.5 IMPROVEMENT WITH RAIN: {pm25_improvement:.1f}%")
         logger.info(f"   Without rain: {no_rain_pm25:.2f} μg/m³")
         logger.info(f"   With rain: {with_rain_pm25:.2f} μg/m³")
 
-    return precip_analysis
-
-
-def analyze_wind_effect(df: pl.DataFrame) -> pl.DataFrame:
-    """Analyze wind speed effects using Polars"""
 
-    logger.info("\n💨 WIND SPEED IMPACT ANALYSIS")
-    logger.info("=" * 35)
+def analyze_wind_effect(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Build lazy wind speed effects analysis using Polars"""
 
-    # Create wind speed categories
+    # Create wind speed categories as a Categorical, grouped by its integer codes
     df_with_wind_cat = df.with_columns(
         [
-            pl.when(pl.col("wind_speed_10m") <= 3)
-            .then(pl.lit("Light (0-3 km/h)"))
-            .when(pl.col("wind_speed_10m") <= 7)
-            .then(pl.lit("Gentle (3-7 km/h)"))
-            .when(pl.col("wind_speed_10m") <= 12)
-            .then(pl.lit("Moderate (7-12 km/h)"))
-            .otherwise(pl.lit("Strong (>12 km/h)"))
+            pl.col("wind_speed_10m")
+            .cut(
+                [3.0, 7.0, 12.0],
+                labels=[
+                    "Light (0-3 km/h)",
+                    "Gentle (3-7 km/h)",
+                    "Moderate (7-12 km/h)",
+                    "Strong (>12 km/h)",
+                ],
+            )
             .alias("wind_category")
         ]
     )
@@ -83,36 +98,33 @@ def analyze_wind_effect(df: pl.DataFrame) -> pl.DataFrame:
         .sort("avg_wind_speed")
     )
 
-    logger.info(wind_analysis)
+    return wind_analysis
 
-    # Calculate direct correlations
-    wind_pm25_corr = df.select(
-        [pl.corr("wind_speed_10m", "pm2_5").alias("wind_pm25_correlation")]
-    ).item()
 
-    wind_pm10_corr = df.select(
-        [pl.corr("wind_speed_10m", "pm10").alias("wind_pm10_correlation")]
-    ).item()
+def report_wind_effect(wind_analysis: pl.DataFrame, correlations: pl.DataFrame) -> None:
+    """Log collected wind speed effects analysis"""
 
-    logger.info("\n📈 DIRECT WIND CORRELATIONS:")
-    logger.info(f"   Wind Speed ↔ PM2.5: {wind_pm25_corr:.3f}")
-    logger.info(f"   Wind Speed ↔ PM10:  {wind_pm10_corr:.3f}")
+    logger.info("\n💨 WIND SPEED IMPACT ANALYSIS")
+    logger.info("=" * 35)
 
-    return wind_analysis
+    logger.info(wind_analysis)
 
+    row = correlations.row(0, named=True)
 
-def analyze_hourly_patterns(df: pl.DataFrame) -> pl.DataFrame:
-    """Analyze hourly patterns using Polars"""
+    logger.info("\n📈 DIRECT WIND CORRELATIONS:")
+    logger.info(f"   Wind Speed ↔ PM2.5: {row['wind_pm25_correlation']:.3f}")
+    logger.info(f"   Wind Speed ↔ PM10:  {row['wind_pm10_correlation']:.3f}")
 
-    logger.info("\n⏰ HOURLY PATTERNS ANALYSIS")
-    logger.info("=" * 30)
+
+def analyze_hourly_patterns(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Build lazy hourly patterns analysis using Polars"""
 
     # Add hour column
     df_with_hour = df.with_columns([pl.col("time").dt.hour().alias("hour")])
 
     # Group by hour
     hourly_stats = (
-        df_with_hour.group_by("hour")
+        df_with_hour.group_by("hour", maintain_order=False)
         .agg(
             [
                 pl.col("pm2_5").mean().alias("avg_pm2_5"),
@@ -125,42 +137,42 @@ def analyze_hourly_patterns(df: pl.DataFrame) -> pl.DataFrame:
         .sort("hour")
     )
 
+    return hourly_stats
+
+
+def report_hourly_patterns(hourly_stats: pl.DataFrame) -> None:
+    """Log collected hourly patterns analysis"""
+
+    logger.info("\n⏰ HOURLY PATTERNS ANALYSIS")
+    logger.info("=" * 30)
+
     logger.info(hourly_stats)
 
     # Find peak pollution hours
-    max_pm25_hour = hourly_stats.filter(
-        pl.col("avg_pm2_5") == hourly_stats["avg_pm2_5"].max()
-    )["hour"].item()
-
-    min_pm25_hour = hourly_stats.filter(
-        pl.col("avg_pm2_5") == hourly_stats["avg_pm2_5"].min()
-    )["hour"].item()
+    max_pm25_hour, min_pm25_hour = hourly_stats.select(
+        [
+            pl.col("hour").get(pl.col("avg_pm2_5").arg_max()).alias("max_pm25_hour"),
+            pl.col("hour").get(pl.col("avg_pm2_5").arg_min()).alias("min_pm25_hour"),
+        ]
+    ).row(0)
 
     logger.info("\n🎯 KEY FINDINGS:")
     logger.info(f"   Peak PM2.5 hour: {max_pm25_hour}:00")
     logger.info(f"   Lowest PM2.5 hour: {min_pm25_hour}:00")
 
-    return hourly_stats
-
 
-def analyze_temperature_humidity_relationship(df: pl.DataFrame) -> pl.DataFrame:
-    """Analyze temperature and humidity effects on air quality"""
-
-    logger.info("\n🌡️ TEMPERATURE & HUMIDITY ANALYSIS")
-    logger.info("=" * 40)
+def analyze_temperature_humidity_relationship(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Build lazy temperature and humidity effects on air quality analysis"""
 
     # Create temperature categories
     df_with_temp_cat = df.with_columns(
         [
-            pl.when(pl.col("temperature_2m") < 0)
-            .then(pl.lit("Below 0°C"))
-            .when(pl.col("temperature_2m") < 10)
-            .then(pl.lit("0-10°C"))
-            .when(pl.col("temperature_2m") < 20)
-            .then(pl.lit("10-20°C"))
-            .when(pl.col("temperature_2m") < 30)
-            .then(pl.lit("20-30°C"))
-            .otherwise(pl.lit("Above 30°C"))
+            pl.col("temperature_2m")
+            .cut(
+                [0.0, 10.0, 20.0, 30.0],
+                labels=["Below 0°C", "0-10°C", "10-20°C", "20-30°C", "Above 30°C"],
+                left_closed=True,
+            )
             .alias("temp_category")
         ]
     )
@@ -179,12 +191,35 @@ def analyze_temperature_humidity_relationship(df: pl.DataFrame) -> pl.DataFrame:
         .sort("avg_temperature")
     )
 
+    return temp_analysis
+
+
+def report_temperature_humidity_relationship(
+    temp_analysis: pl.DataFrame, correlations: pl.DataFrame
+) -> None:
+    """Log collected temperature and humidity effects on air quality"""
+
+    logger.info("\n🌡️ TEMPERATURE & HUMIDITY ANALYSIS")
+    logger.info("=" * 40)
+
     logger.info("📊 Air Quality by Temperature Range:")
     logger.info(temp_analysis)
 
-    # Direct correlations
-    temp_correlations = df.select(
+    logger.info("\n📈 TEMPERATURE & HUMIDITY CORRELATIONS:")
+    row = correlations.row(0, named=True)
+    logger.info(f"   Temperature ↔ PM2.5: {row['temp_pm25_corr']:.3f}")
+    logger.info(f"   Temperature ↔ Ozone: {row['temp_ozone_corr']:.3f}")
+    logger.info(f"   Humidity ↔ PM2.5: {row['humidity_pm25_corr']:.3f}")
+    logger.info(f"   Humidity ↔ Ozone: {row['humidity_ozone_corr']:.3f}")
+
+
+def analyze_correlations(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Build every direct correlation as a single lazy select"""
+
+    return df.select(
         [
+            pl.corr("wind_speed_10m", "pm2_5").alias("wind_pm25_correlation"),
+            pl.corr("wind_speed_10m", "pm10").alias("wind_pm10_correlation"),
             pl.corr("temperature_2m", "pm2_5").alias("temp_pm25_corr"),
             pl.corr("temperature_2m", "ozone").alias("temp_ozone_corr"),
             pl.corr("relative_humidity_2m", "pm2_5").alias("humidity_pm25_corr"),
@@ -192,56 +227,86 @@ def analyze_temperature_humidity_relationship(df: pl.DataFrame) -> pl.DataFrame:
         ]
     )
 
-    logger.info("\n📈 TEMPERATURE & HUMIDITY CORRELATIONS:")
-    for row in temp_correlations.iter_rows(named=True):
-        logger.info(f"   Temperature ↔ PM2.5: {row['temp_pm25_corr']:.3f}")
-        logger.info(f"   Temperature ↔ Ozone: {row['temp_ozone_corr']:.3f}")
-        logger.info(f"   Humidity ↔ PM2.5: {row['humidity_pm25_corr']:.3f}")
-        logger.info(f"   Humidity ↔ Ozone: {row['humidity_ozone_corr']:.3f}")
 
-    return temp_analysis
+SUMMARY_COLUMNS: list[str] = [
+    "temperature_2m",
+    "relative_humidity_2m",
+    "precipitation",
+    "wind_speed_10m",
+    "pm10",
+    "pm2_5",
+    "carbon_monoxide",
+    "nitrogen_dioxide",
+    "ozone",
+]
+
+SUMMARY_STATISTICS: dict[str, Callable[[pl.Expr], pl.Expr]] = {
+    "min": pl.Expr.min,
+    "max": pl.Expr.max,
+    "mean": pl.Expr.mean,
+    "std": pl.Expr.std,
+    "median": pl.Expr.median,
+}
 
 
-def generate_summary_statistics(df):
-    """Generate comprehensive summary statistics"""
+def analyze_summary_statistics(df: pl.LazyFrame) -> pl.LazyFrame:
+    """Build lazy summary statistics over the analysed columns as one select"""
+
+    total_columns: int = df.collect_schema().len()
+
+    return df.select(
+        [
+            statistic(pl.col(column)).alias(f"{column}_{name}")
+            for column in SUMMARY_COLUMNS
+            for name, statistic in SUMMARY_STATISTICS.items()
+        ]
+        + [
+            pl.len().alias("total_records"),
+            pl.lit(total_columns).alias("total_columns"),
+            (pl.col("time").max() - pl.col("time").min())
+            .dt.total_days()
+            .alias("date_range_days"),
+            pl.sum_horizontal(pl.all().null_count()).alias("total_nulls"),
+        ]
+    )
+
+
+def report_summary_statistics(summary: pl.DataFrame) -> None:
+    """Log collected summary statistics"""
 
     logger.info("\n📈 SUMMARY STATISTICS")
     logger.info("=" * 25)
 
-    # Basic descriptive statistics
-    summary = df.select(
+    row = summary.row(0, named=True)
+
+    # Basic descriptive statistics, one line per column
+    statistics_df = pl.DataFrame(
         [
-            pl.col(
-                "temperature_2m",
-                "relative_humidity_2m",
-                "precipitation",
-                "wind_speed_10m",
-                "pm10",
-                "pm2_5",
-                "carbon_monoxide",
-                "nitrogen_dioxide",
-                "ozone",
-            )
+            {
+                "column": column,
+                **{name: row[f"{column}_{name}"] for name in SUMMARY_STATISTICS},
+            }
+            for column in SUMMARY_COLUMNS
         ]
-    ).describe()
+    )
 
-    logger.info(summary)
+    logger.info(statistics_df)
 
     # Data quality metrics
+    total_cells = row["total_records"] * row["total_columns"]
+    data_completeness = (1 - row["total_nulls"] / total_cells) * 100
+
     logger.info("\n🔍 DATA QUALITY METRICS:")
-    logger.info(f"   Total records: {df.height:,}")
-    logger.info(f"   Total columns: {df.width}")
-    logger.info(
-        f"   Date range: {(df['datetime'].max() - df['datetime'].min()).dt.total_days()} days"
-    )
+    logger.info(f"   Total records: {row['total_records']:,}")
+    logger.info(f"   Analysed columns: {row['total_columns']}")
+    logger.info(f"   Date range: {row['date_range_days']} days")
+    logger.info(f"   Data completeness over analysed columns: {data_completeness:.2f}%")
+    logger.info(f"   Null values in analysed columns: {row['total_nulls']}")
 
-    # Null counts
-    null_counts = df.null_count()
-    total_nulls = null_counts.sum_horizontal().sum()
-    data_completeness = (1 - total_nulls / (df.height * df.width)) * 100
 
-    logger.info(f"   Data completeness: {data_completeness:.2f}%")
-    logger.info(f"   Total null values: {total_nulls}")
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    Path(path).mkdir(parents=True, exist_ok=True)
 
 
 def _get_output_path(
@@ -250,7 +315,7 @@ def _get_output_path(
 ) -> Path:
     write_path: Path = base_output_path / execution_time
 
-    write_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(str(write_path))
     return write_path
 
 
@@ -259,18 +324,59 @@ def calculate_analytics(
     base_output_path: Path,
     execution_time: str,
 ) -> None:
-    data_df: pl.DataFrame = pl.read_parquet(base_input_path / execution_time)
+    # Only decode the columns the analyses actually use
+    data_lf: pl.LazyFrame = pl.scan_parquet(base_input_path / execution_time).select(
+        [
+            "time",
+            "temperature_2m",
+            "relative_humidity_2m",
+            "precipitation",
+            "wind_speed_10m",
+            "pm10",
+            "pm2_5",
+            "carbon_monoxide",
+            "nitrogen_dioxide",
+            "ozone",
+        ]
+    )
 
-    precipitation_df: pl.DataFrame = analyze_precipitation_effect(data_df)
-    wind_df: pl.DataFrame = analyze_wind_effect(data_df)
-    hourly_patterns: pl.DataFrame = analyze_hourly_patterns(data_df)
-    humidity_df: pl.DataFrame = analyze_temperature_humidity_relationship(data_df)
+    # All analyses share a single scan of the silver layer
+    (
+        precipitation_df,
+        wind_df,
+        hourly_patterns,
+        humidity_df,
+        correlations,
+        summary,
+    ) = pl.collect_all(
+        [
+            analyze_precipitation_effect(data_lf),
+            analyze_wind_effect(data_lf),
+            analyze_hourly_patterns(data_lf),
+            analyze_temperature_humidity_relationship(data_lf),
+            analyze_correlations(data_lf),
+            analyze_summary_statistics(data_lf),
+        ],
+        engine="streaming",
+    )
+
+    report_precipitation_effect(precipitation_df)
+    report_wind_effect(wind_df, correlations)
+    report_hourly_patterns(hourly_patterns)
+    report_temperature_humidity_relationship(humidity_df, correlations)
+    report_summary_statistics(summary)
 
     output_path: Path = _get_output_path(
         base_output_path=base_output_path, execution_time=execution_time
     )
 
-    precipitation_df.write_csv(output_path / "precipitation.csv")
-    wind_df.write_csv(output_path / "wind.csv")
-    hourly_patterns.write_csv(output_path / "hourly_patterns.csv")
-    humidity_df.write_csv(output_path / "humidity_df.csv")
+    reports: list[tuple[pl.DataFrame, Path]] = [
+        (precipitation_df, output_path / "precipitation.csv"),
+        (wind_df, output_path / "wind.csv"),
+        (hourly_patterns, output_path / "hourly_patterns.csv"),
+        (humidity_df, output_path / "humidity_df.csv"),
+    ]
+
+    # Polars releases the GIL while writing, so the CSVs are written in parallel
+    with ThreadPoolExecutor(max_workers=len(reports)) as executor:
+        list(executor.map(lambda report: report[0].write_csv(report[1]), reports))
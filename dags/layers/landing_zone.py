@@ -1,96 +1,167 @@
+import asyncio
 import datetime
-import requests
+import httpx
+from dataclasses import dataclass
 from loguru import logger
 from pathlib import Path
+from functools import lru_cache
 
 
-def _get_data_from_api(
+@dataclass
+class City:
+    latitude: float
+    longitude: float
+    name: str
+
+
+WEATHER_API_URL: str = "https://api.open-meteo.com/v1/forecast"
+WEATHER_INDICATORS: list[str] = [
+    "temperature_2m",
+    "relative_humidity_2m",
+    "precipitation",
+    "wind_speed_10m",
+    "wind_direction_10m",
+]
+
+AIR_QUALITY_API_URL: str = "https://air-quality-api.open-meteo.com/v1/air-quality"
+AIR_QUALITY_INDICATORS: list[str] = [
+    "pm10",
+    "pm2_5",
+    "carbon_monoxide",
+    "nitrogen_dioxide",
+    "ozone",
+]
+
+# Both APIs must cover the same hours so silver can align them row by row.
+# Use the air quality API's default horizon, which its models actually forecast.
+FORECAST_DAYS: int = 5
+
+_TIMEOUT: httpx.Timeout = httpx.Timeout(30, connect=3.05)
+_MAX_RETRIES: int = 3
+_BACKOFF_FACTOR: float = 0.5
+_RETRY_STATUS_CODES: set[int] = {429, 500, 502, 503, 504}
+
+
+async def _request_api_data_async(
+    client: httpx.AsyncClient,
     api_url: str,
     indicators: list[str],
     latitude: float,
     longitude: float,
-    city_name: str,
-    write_path: Path,
-) -> None:
-    query_params: dict[str, float | list[str]] = {
+) -> bytes:
+    query_params: dict[str, float | int | list[str]] = {
         "latitude": latitude,
         "longitude": longitude,
         "hourly": indicators,
+        "forecast_days": FORECAST_DAYS,
     }
-    api_response: requests.models.Response = requests.get(api_url, params=query_params)
+    # Retry connection errors and throttled/5xx responses with exponential backoff
+    for attempt in range(_MAX_RETRIES + 1):
+        try:
+            api_response: httpx.Response = await client.get(
+                api_url, params=query_params
+            )
+        except httpx.TransportError:
+            if attempt == _MAX_RETRIES:
+                raise
+        else:
+            if (
+                api_response.status_code not in _RETRY_STATUS_CODES
+                or attempt == _MAX_RETRIES
+            ):
+                break
+        await asyncio.sleep(_BACKOFF_FACTOR * 2**attempt)
+
     match api_response.status_code:
         case 200:
-            with (write_path / f"{city_name}.json").open("w") as file:
-                file.write(api_response.content.decode("utf-8"))
+            return api_response.content
         case _:
-            raise requests.HTTPError("Incorrect status code")
+            raise httpx.HTTPError("Incorrect status code")
 
 
-def _get_path_to_write(
-    base_output_path: Path, execution_time: str, prefix: str
-) -> Path:
-    write_path: Path = base_output_path / execution_time / prefix
-    write_path.mkdir(parents=True, exist_ok=True)
-    return write_path
+def request_api_data(
+    api_url: str,
+    indicators: list[str],
+    latitude: float,
+    longitude: float,
+) -> bytes:
+    async def _request() -> bytes:
+        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+            return await _request_api_data_async(
+                client=client,
+                api_url=api_url,
+                indicators=indicators,
+                latitude=latitude,
+                longitude=longitude,
+            )
 
+    return asyncio.run(_request())
 
-def query_weather_api(
-    base_output_path: Path,
-    execution_time: str,
+
+async def _get_data_from_api_async(
+    client: httpx.AsyncClient,
+    api_url: str,
+    indicators: list[str],
     latitude: float,
     longitude: float,
     city_name: str,
-    indicators: list[str] = [
-        "temperature_2m",
-        "relative_humidity_2m",
-        "precipitation",
-        "wind_speed_10m",
-        "wind_direction_10m",
-    ],
-    weather_api_url: str = "https://api.open-meteo.com/v1/forecast",
+    write_path: Path,
 ) -> None:
-    logger.info(f"Getting weather data for {city_name}")
-    write_path: Path = _get_path_to_write(
-        base_output_path=base_output_path,
-        execution_time=execution_time,
-        prefix="weather_data",
-    )
-    _get_data_from_api(
-        api_url=weather_api_url,
+    content: bytes = await _request_api_data_async(
+        client=client,
+        api_url=api_url,
         indicators=indicators,
         latitude=latitude,
         longitude=longitude,
-        city_name=city_name,
-        write_path=write_path,
     )
+    (write_path / f"{city_name}.json").write_bytes(content)
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    Path(path).mkdir(parents=True, exist_ok=True)
 
 
-def query_air_quality_api(
+def _get_path_to_write(
+    base_output_path: Path, execution_time: str, prefix: str
+) -> Path:
+    write_path: Path = base_output_path / execution_time / prefix
+    _ensure_dir(str(write_path))
+    return write_path
+
+
+def fetch_all_async(
     base_output_path: Path,
     execution_time: str,
-    latitude: float,
-    longitude: float,
-    city_name: str,
-    indicators: list[str] = [
-        "pm10",
-        "pm2_5",
-        "carbon_monoxide",
-        "nitrogen_dioxide",
-        "ozone",
-    ],
-    weather_api_url: str = "https://air-quality-api.open-meteo.com/v1/air-quality",
+    cities: list[City],
 ) -> None:
-    logger.info(f"Getting air quality data for {city_name}")
-    write_path: Path = _get_path_to_write(
-        base_output_path=base_output_path,
-        execution_time=execution_time,
-        prefix="air_quality_data",
-    )
-    _get_data_from_api(
-        api_url=weather_api_url,
-        indicators=indicators,
-        latitude=latitude,
-        longitude=longitude,
-        city_name=city_name,
-        write_path=write_path,
-    )
+    logger.info(f"Getting weather and air quality data for {len(cities)} cities")
+    apis: list[tuple[str, str, list[str]]] = [
+        ("weather_data", WEATHER_API_URL, WEATHER_INDICATORS),
+        ("air_quality_data", AIR_QUALITY_API_URL, AIR_QUALITY_INDICATORS),
+    ]
+
+    async def _fetch_all() -> None:
+        # One event loop drives every request over the client's connection pool
+        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
+            await asyncio.gather(
+                *[
+                    _get_data_from_api_async(
+                        client=client,
+                        api_url=api_url,
+                        indicators=indicators,
+                        latitude=city.latitude,
+                        longitude=city.longitude,
+                        city_name=city.name,
+                        write_path=_get_path_to_write(
+                            base_output_path=base_output_path,
+                            execution_time=execution_time,
+                            prefix=prefix,
+                        ),
+                    )
+                    for city in cities
+                    for prefix, api_url, indicators in apis
+                ]
+            )
+
+    asyncio.run(_fetch_all())
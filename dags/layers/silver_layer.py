@@ -2,8 +2,8 @@ import polars as pl
 import datetime
 from loguru import logger
 from pathlib import Path
+from functools import lru_cache
 from functools import reduce
-from uuid import uuid4
 
 
 def _get_input_path(
@@ -14,13 +14,18 @@ def _get_input_path(
     return base_input_path / execution_time / prefix
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
 def _get_output_path(
     base_output_path: Path,
     execution_time: str,
 ) -> Path:
     write_path: Path = base_output_path / execution_time
 
-    write_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(str(write_path))
     return write_path
 
 
@@ -41,18 +46,31 @@ def merge_and_clean_dataframes(
         prefix_df: pl.LazyFrame = pl.scan_parquet(input_path)
         dfs_list.append(prefix_df)
 
-    joint_df: pl.LazyFrame = reduce(
-        lambda left_df, right_df: left_df.join(
-            right_df, how="inner", on=["time", "city_name"]
-        ),
-        dfs_list,
+    join_keys: list[str] = ["city_name", "time"]
+    sorted_dfs: list[pl.DataFrame] = pl.collect_all(
+        [prefix_df.sort(join_keys) for prefix_df in dfs_list]
     )
 
-    adjusted_types_df: pl.LazyFrame = joint_df.cast({"time": pl.Datetime})
-
-    adjusted_types_df.sink_parquet(
-        _get_output_path(
-            base_output_path=base_output_path, execution_time=execution_time
+    first_df, *other_dfs = sorted_dfs
+    keys_df: pl.DataFrame = first_df.select(join_keys)
+    if all(other_df.select(join_keys).equals(keys_df) for other_df in other_dfs):
+        # Every prefix covers the same keys, so rows already line up after sorting
+        joint_df: pl.DataFrame = pl.concat(
+            [first_df, *[other_df.drop(join_keys) for other_df in other_dfs]],
+            how="horizontal",
+        )
+    else:
+        joint_df = reduce(
+            lambda left_df, right_df: left_df.join(right_df, how="inner", on=join_keys),
+            sorted_dfs,
         )
-        / f"{str(uuid4())}.parquet"
+
+    output_path: Path = _get_output_path(
+        base_output_path=base_output_path, execution_time=execution_time
     )
+
+    # Reruns replace the partition, including files left by earlier runs
+    for stale_file in output_path.glob("*.parquet"):
+        stale_file.unlink()
+
+    joint_df.write_parquet(output_path / "merged.parquet")